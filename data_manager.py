@@ -4,10 +4,32 @@ Handles saving and loading timetable data
 """
 import json
 import os
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from models import Timetable, Subject, ClassSession, TimeSlot
 
+# Use orjson for encoding/decoding when available, stdlib json otherwise
+try:
+    import orjson
+    
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    _loads = json.loads
+
+# ijson lets us pull out timetable names without parsing whole timetables
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
 class DataManager:
     """Manages data persistence for the timetable application"""
     
@@ -17,25 +39,91 @@ class DataManager:
         self.timetables_file = self.data_dir / "timetables.json"
         self.subjects_file = self.data_dir / "subjects.json"
         self.settings_file = self.data_dir / "settings.json"
+        # Serializes file writes, which may come from worker threads
+        self._write_lock = threading.Lock()
+        
+        # Parsed contents of timetables.json keyed by name, reused while the file is unchanged
+        self._timetables_cache: Optional[Dict[str, dict]] = None
+        self._timetables_mtime: Optional[int] = None
+        # Names streamed from timetables.json, for when the full cache is cold
+        self._names_cache: Optional[List[str]] = None
+        self._names_mtime: Optional[int] = None
+    
+    def _timetables_file_mtime(self) -> Optional[int]:
+        """Get the modification time of the timetables file, or None if missing"""
+        try:
+            return os.stat(self.timetables_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
+    def _is_cache_fresh(self, mtime: Optional[int]) -> bool:
+        """Check whether the cached timetables match the file on disk"""
+        return self._timetables_cache is not None and mtime == self._timetables_mtime
+    
+    def _read_json(self, file_path):
+        """Read a whole JSON file into memory and parse it"""
+        return _loads(Path(file_path).read_bytes())
+    
+    def _write_json(self, file_path, data):
+        """Serialize data and atomically replace the file with it"""
+        file_path = Path(file_path)
+        tmp_path = file_path.with_name(file_path.name + '.tmp')
+        content = _dumps(data)
+        
+        # Write to a temporary file first so a crash never leaves a half-written file
+        with self._write_lock:
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, file_path)
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
+    
+    def _load_timetables_index(self) -> Dict[str, dict]:
+        """Get all stored timetables keyed by name, parsing the file only if it changed"""
+        mtime = self._timetables_file_mtime()
+        if self._is_cache_fresh(mtime):
+            return self._timetables_cache
+        
+        timetables = {}
+        if mtime is not None:
+            for timetable_data in self._read_json(self.timetables_file):
+                timetables.setdefault(timetable_data['name'], timetable_data)
+        
+        self._timetables_cache = timetables
+        self._timetables_mtime = mtime
+        return timetables
+    
+    def _write_timetables(self, timetables: Dict[str, dict]):
+        """Write all timetables to file and refresh the in-memory cache"""
+        try:
+            self._write_json(self.timetables_file, list(timetables.values()))
+        except Exception:
+            self._timetables_cache = None
+            self._timetables_mtime = None
+            raise
+        
+        self._timetables_cache = timetables
+        self._timetables_mtime = self._timetables_file_mtime()
     
     def save_timetable(self, timetable: Timetable) -> bool:
         """Save a timetable to file"""
+        return self.save_timetables([timetable])
+    
+    def save_timetables(self, timetables: List[Timetable]) -> bool:
+        """Save several timetables to file with a single write"""
         try:
-            timetables = self.load_all_timetables()
-            
-            # Update existing or add new timetable
-            updated = False
-            for i, existing in enumerate(timetables):
-                if existing['name'] == timetable.name:
-                    timetables[i] = timetable.to_dict()
-                    updated = True
-                    break
+            # Work on a copy so the cache stays intact if serialization fails
+            stored = dict(self._load_timetables_index())
             
-            if not updated:
-                timetables.append(timetable.to_dict())
+            # Update existing or add new timetables
+            for timetable in timetables:
+                stored[timetable.name] = timetable.to_dict()
             
-            with open(self.timetables_file, 'w', encoding='utf-8') as f:
-                json.dump(timetables, f, indent=2, ensure_ascii=False)
+            self._write_timetables(stored)
             
             return True
         except Exception as e:
@@ -45,22 +133,18 @@ class DataManager:
     def load_timetable(self, name: str) -> Optional[Timetable]:
         """Load a specific timetable by name"""
         try:
-            timetables = self.load_all_timetables()
-            for timetable_data in timetables:
-                if timetable_data['name'] == name:
-                    return Timetable.from_dict(timetable_data)
+            timetable_data = self._load_timetables_index().get(name)
+            if timetable_data is not None:
+                return Timetable.from_dict(timetable_data)
             return None
         except Exception as e:
             print(f"Error loading timetable: {e}")
             return None
     
     def load_all_timetables(self) -> List[dict]:
-        """Load all timetables from file"""
+        """Load all timetables from file as dicts shared with the cache, which callers must not mutate"""
         try:
-            if self.timetables_file.exists():
-                with open(self.timetables_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return []
+            return list(self._load_timetables_index().values())
         except Exception as e:
             print(f"Error loading timetables: {e}")
             return []
@@ -68,8 +152,19 @@ class DataManager:
     def get_timetable_names(self) -> List[str]:
         """Get list of all timetable names"""
         try:
-            timetables = self.load_all_timetables()
-            return [timetable['name'] for timetable in timetables]
+            mtime = self._timetables_file_mtime()
+            if mtime is None:
+                return []
+            
+            # Without a warm cache, stream only the top-level names
+            if ijson is not None and not self._is_cache_fresh(mtime):
+                if self._names_cache is None or mtime != self._names_mtime:
+                    with open(self.timetables_file, 'rb') as f:
+                        self._names_cache = list(ijson.items(f, 'item.name'))
+                    self._names_mtime = mtime
+                return list(self._names_cache)
+            
+            return list(self._load_timetables_index())
         except Exception as e:
             print(f"Error getting timetable names: {e}")
             return []
@@ -77,11 +172,11 @@ class DataManager:
     def delete_timetable(self, name: str) -> bool:
         """Delete a timetable"""
         try:
-            timetables = self.load_all_timetables()
-            timetables = [t for t in timetables if t['name'] != name]
-            
-            with open(self.timetables_file, 'w', encoding='utf-8') as f:
-                json.dump(timetables, f, indent=2, ensure_ascii=False)
+            timetables = self._load_timetables_index()
+            if name in timetables:
+                timetables = dict(timetables)
+                del timetables[name]
+                self._write_timetables(timetables)
             
             return True
         except Exception as e:
@@ -91,19 +186,9 @@ class DataManager:
     def save_subjects(self, subjects: List[Subject]) -> bool:
         """Save subjects to file"""
         try:
-            subjects_data = [
-                {
-                    'name': subject.name,
-                    'code': subject.code,
-                    'credits': subject.credits,
-                    'instructor': subject.instructor,
-                    'color': subject.color
-                }
-                for subject in subjects
-            ]
-            
-            with open(self.subjects_file, 'w', encoding='utf-8') as f:
-                json.dump(subjects_data, f, indent=2, ensure_ascii=False)
+            subjects_data = [subject.to_dict() for subject in subjects]
+            
+            self._write_json(self.subjects_file, subjects_data)
             
             return True
         except Exception as e:
@@ -114,8 +199,7 @@ class DataManager:
         """Load subjects from file"""
         try:
             if self.subjects_file.exists():
-                with open(self.subjects_file, 'r', encoding='utf-8') as f:
-                    subjects_data = json.load(f)
+                subjects_data = self._read_json(self.subjects_file)
                 
                 return [Subject(**subject_data) for subject_data in subjects_data]
             return []
@@ -126,8 +210,7 @@ class DataManager:
     def save_settings(self, settings: dict) -> bool:
         """Save application settings"""
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            self._write_json(self.settings_file, settings)
             return True
         except Exception as e:
             print(f"Error saving settings: {e}")
@@ -137,8 +220,7 @@ class DataManager:
         """Load application settings"""
         try:
             if self.settings_file.exists():
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self._read_json(self.settings_file)
             return self.get_default_settings()
         except Exception as e:
             print(f"Error loading settings: {e}")
@@ -162,8 +244,7 @@ class DataManager:
     def export_to_json(self, timetable: Timetable, file_path: str) -> bool:
         """Export timetable to a JSON file"""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(timetable.to_dict(), f, indent=2, ensure_ascii=False)
+            self._write_json(file_path, timetable.to_dict())
             return True
         except Exception as e:
             print(f"Error exporting timetable: {e}")
@@ -172,8 +253,7 @@ class DataManager:
     def import_from_json(self, file_path: str) -> Optional[Timetable]:
         """Import timetable from a JSON file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json(file_path)
             return Timetable.from_dict(data)
         except Exception as e:
             print(f"Error importing timetable: {e}")
@@ -189,38 +269,113 @@ class DataManager:
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 
                 writer.writeheader()
-                for session in timetable.sessions:
-                    writer.writerow({
+                writer.writerows([
+                    {
                         'Day': session.day,
-                        'Time': str(session.time_slot),
+                        'Time': f"{session.time_slot.start_time} - {session.time_slot.end_time}",
                         'Subject': session.subject.name,
                         'Code': session.subject.code,
                         'Room': session.room,
                         'Type': session.session_type,
                         'Instructor': session.subject.instructor,
                         'Notes': session.notes
-                    })
+                    }
+                    for session in timetable.sessions
+                ])
             
             return True
         except Exception as e:
             print(f"Error exporting to CSV: {e}")
             return False
     
-    def create_backup(self) -> bool:
-        """Create a backup of all data"""
+    def create_backup(self, background: bool = False) -> bool:
+        """Create a backup of all data, optionally on a worker thread"""
+        if background:
+            threading.Thread(target=self._write_backup, daemon=True).start()
+            return True
+        return self._write_backup()
+    
+    def _write_backup(self) -> bool:
+        """Archive the data files unless they are unchanged since the last backup"""
         try:
-            import shutil
+            import zipfile
             from datetime import datetime
             
             backup_dir = self.data_dir / "backups"
             backup_dir.mkdir(exist_ok=True)
+            manifest_file = backup_dir / ".manifest.json"
+            
+            # Don't include earlier backups or in-progress writes in the new one
+            files = {}
+            for path in sorted(self.data_dir.rglob('*')):
+                relative_path = path.relative_to(self.data_dir)
+                if (relative_path.parts[0] == backup_dir.name or not path.is_file()
+                        or path.suffix == '.tmp'):
+                    continue
+                stat = path.stat()
+                files[relative_path.as_posix()] = [stat.st_mtime_ns, stat.st_size]
+            
+            # Skip the archive entirely if the latest backup already has these files
+            if manifest_file.exists():
+                manifest = self._read_json(manifest_file)
+                if (manifest.get('files') == files
+                        and (backup_dir / manifest.get('archive', '')).is_file()):
+                    return True
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = backup_dir / f"backup_{timestamp}.zip"
+            tmp_file = backup_file.with_name(backup_file.name + '.tmp')
+            
+            # The data files are small JSON, so light compression is plenty
+            with zipfile.ZipFile(tmp_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+                for relative_path in files:
+                    zf.write(self.data_dir / relative_path, relative_path)
+            os.replace(tmp_file, backup_file)
             
-            shutil.make_archive(str(backup_file).replace('.zip', ''), 'zip', self.data_dir)
+            self._write_json(manifest_file, {'archive': backup_file.name, 'files': files})
             
             return True
         except Exception as e:
             print(f"Error creating backup: {e}")
             return False
+
+class BufferedDataManager(DataManager):
+    """DataManager that collects timetable saves in memory and writes them on flush"""
+    
+    def __init__(self, data_dir: str = "data"):
+        super().__init__(data_dir)
+        self._dirty: Dict[str, Timetable] = {}
+    
+    def mark_dirty(self, timetable: Timetable):
+        """Queue a timetable to be written on the next flush"""
+        self._dirty[timetable.name] = timetable
+    
+    def save_timetables(self, timetables: List[Timetable]) -> bool:
+        """Save several timetables now, dropping any queued saves they cover"""
+        if not super().save_timetables(timetables):
+            return False
+        
+        for timetable in timetables:
+            if self._dirty.get(timetable.name) is timetable:
+                del self._dirty[timetable.name]
+        return True
+    
+    def has_pending_changes(self) -> bool:
+        """Check whether any timetables are waiting to be written"""
+        return bool(self._dirty)
+    
+    def flush(self) -> bool:
+        """Write all queued timetables in a single save"""
+        if not self._dirty:
+            return True
+        
+        pending = list(self._dirty.values())
+        self._dirty.clear()
+        if self.save_timetables(pending):
+            return True
+        
+        # Keep failed timetables queued for the next attempt
+        for timetable in pending:
+            self._dirty.setdefault(timetable.name, timetable)
+        return False
+
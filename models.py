@@ -1,12 +1,17 @@
 """
 Data models for the Timetable Management System
 """
-from dataclasses import dataclass, asdict
-from typing import List, Optional
+from dataclasses import dataclass, field, fields, MISSING
+from typing import Dict, List, Optional
+from collections import defaultdict
 from datetime import datetime, time
 import json
+import sys
 
-@dataclass
+# Slotted dataclasses are only available on Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TimeSlot:
     """Represents a time slot for a class"""
     start_time: str  # Format: "HH:MM"
@@ -14,8 +19,12 @@ class TimeSlot:
     
     def __str__(self):
         return f"{self.start_time} - {self.end_time}"
+    
+    def to_dict(self):
+        """Convert time slot to dictionary for JSON serialization"""
+        return {'start_time': self.start_time, 'end_time': self.end_time}
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Subject:
     """Represents a subject/course"""
     name: str
@@ -26,8 +35,18 @@ class Subject:
     
     def __str__(self):
         return f"{self.code}: {self.name}"
+    
+    def to_dict(self):
+        """Convert subject to dictionary for JSON serialization"""
+        return {
+            'name': self.name,
+            'code': self.code,
+            'credits': self.credits,
+            'instructor': self.instructor,
+            'color': self.color
+        }
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ClassSession:
     """Represents a single class session"""
     subject: Subject
@@ -40,7 +59,15 @@ class ClassSession:
     def __str__(self):
         return f"{self.subject.name} ({self.time_slot}) - {self.room}"
 
-@dataclass
+def _field_defaults(cls) -> dict:
+    """Get the default values of a dataclass's fields"""
+    return {f.name: f.default for f in fields(cls) if f.default is not MISSING}
+
+# Defaults for optional keys when building from dicts, taken from the dataclasses
+_SUBJECT_DEFAULTS = _field_defaults(Subject)
+_SESSION_DEFAULTS = _field_defaults(ClassSession)
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Timetable:
     """Main timetable containing all class sessions"""
     name: str
@@ -48,43 +75,84 @@ class Timetable:
     sessions: List[ClassSession]
     created_date: str
     last_modified: str
+    # Lookup indices over sessions, kept in sync by add_session/remove_session
+    _by_day: Dict[str, List[ClassSession]] = field(init=False, repr=False, compare=False)
+    _by_code: Dict[str, List[ClassSession]] = field(init=False, repr=False, compare=False)
+    # Result of the last to_dict call, cleared whenever the timetable changes
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.created_date:
             self.created_date = datetime.now().isoformat()
         self.last_modified = datetime.now().isoformat()
+        self.rebuild_indices()
+    
+    def rebuild_indices(self):
+        """Index all sessions by day and subject code, e.g. after subjects were edited in place"""
+        self._by_day = defaultdict(list)
+        self._by_code = defaultdict(list)
+        for session in self.sessions:
+            self._index_session(session)
+    
+    def _index_session(self, session: ClassSession):
+        """Add a session to the lookup indices"""
+        self._by_day[session.day.lower()].append(session)
+        self._by_code[session.subject.code].append(session)
     
     def add_session(self, session: ClassSession):
         """Add a new class session"""
-        self.sessions.append(session)
-        self.last_modified = datetime.now().isoformat()
+        self.add_sessions([session])
+    
+    def add_sessions(self, sessions: List[ClassSession]):
+        """Add several class sessions, updating the modification time once"""
+        self.sessions.extend(sessions)
+        for session in sessions:
+            self._index_session(session)
+        self.mark_modified()
     
     def remove_session(self, session: ClassSession):
         """Remove a class session"""
         if session in self.sessions:
             self.sessions.remove(session)
-            self.last_modified = datetime.now().isoformat()
+            day_sessions = self._by_day.get(session.day.lower(), ())
+            code_sessions = self._by_code.get(session.subject.code, ())
+            if session in day_sessions and session in code_sessions:
+                day_sessions.remove(session)
+                code_sessions.remove(session)
+            else:
+                # The session's subject changed code after it was indexed
+                self.rebuild_indices()
+            self.mark_modified()
+    
+    def mark_modified(self):
+        """Record a change to the timetable and drop the cached serialization"""
+        self.last_modified = datetime.now().isoformat()
+        self._cached_dict = None
     
     def get_sessions_by_day(self, day: str) -> List[ClassSession]:
         """Get all sessions for a specific day"""
-        return [session for session in self.sessions if session.day.lower() == day.lower()]
+        return list(self._by_day.get(day.lower(), ()))
     
     def get_sessions_by_subject(self, subject_code: str) -> List[ClassSession]:
         """Get all sessions for a specific subject"""
-        return [session for session in self.sessions if session.subject.code == subject_code]
+        return list(self._by_code.get(subject_code, ()))
     
     def to_dict(self):
         """Convert timetable to dictionary for JSON serialization"""
-        return {
+        # Cached until the timetable is modified, so callers must not mutate it
+        if self._cached_dict is not None:
+            return self._cached_dict
+        
+        self._cached_dict = {
             'name': self.name,
             'semester': self.semester,
             'created_date': self.created_date,
             'last_modified': self.last_modified,
             'sessions': [
                 {
-                    'subject': asdict(session.subject),
+                    'subject': session.subject.to_dict(),
                     'day': session.day,
-                    'time_slot': asdict(session.time_slot),
+                    'time_slot': session.time_slot.to_dict(),
                     'room': session.room,
                     'session_type': session.session_type,
                     'notes': session.notes
@@ -92,21 +160,42 @@ class Timetable:
                 for session in self.sessions
             ]
         }
+        return self._cached_dict
     
     @classmethod
     def from_dict(cls, data: dict):
         """Create timetable from dictionary"""
         sessions = []
+        # Sessions with identical subject or time slot data share one instance
+        subjects: Dict[tuple, Subject] = {}
+        time_slots: Dict[tuple, TimeSlot] = {}
         for session_data in data.get('sessions', []):
-            subject = Subject(**session_data['subject'])
-            time_slot = TimeSlot(**session_data['time_slot'])
+            # Fields are passed positionally in declaration order; this avoids
+            # building and matching keyword arguments for every session
+            subject_data = session_data['subject']
+            subject_key = (
+                subject_data['name'],
+                subject_data['code'],
+                subject_data.get('credits', _SUBJECT_DEFAULTS['credits']),
+                subject_data.get('instructor', _SUBJECT_DEFAULTS['instructor']),
+                subject_data.get('color', _SUBJECT_DEFAULTS['color'])
+            )
+            subject = subjects.get(subject_key)
+            if subject is None:
+                subject = subjects[subject_key] = Subject(*subject_key)
+            
+            time_slot_data = session_data['time_slot']
+            time_slot_key = (time_slot_data['start_time'], time_slot_data['end_time'])
+            time_slot = time_slots.get(time_slot_key)
+            if time_slot is None:
+                time_slot = time_slots[time_slot_key] = TimeSlot(*time_slot_key)
             session = ClassSession(
-                subject=subject,
-                day=session_data['day'],
-                time_slot=time_slot,
-                room=session_data.get('room', ''),
-                session_type=session_data.get('session_type', 'Lecture'),
-                notes=session_data.get('notes', '')
+                subject,
+                session_data['day'],
+                time_slot,
+                session_data.get('room', _SESSION_DEFAULTS['room']),
+                session_data.get('session_type', _SESSION_DEFAULTS['session_type']),
+                session_data.get('notes', _SESSION_DEFAULTS['notes'])
             )
             sessions.append(session)
         
@@ -132,6 +221,10 @@ COMMON_TIME_SLOTS = [
     TimeSlot("17:00", "18:00"),
 ]
 
+# Display labels for the common time slots and the reverse lookup
+TIME_SLOT_LABELS = [str(ts) for ts in COMMON_TIME_SLOTS]
+TIME_SLOT_BY_LABEL = dict(zip(TIME_SLOT_LABELS, COMMON_TIME_SLOTS))
+
 # Days of the week
 WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
 
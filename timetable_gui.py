@@ -7,15 +7,54 @@ import tkinter as tk
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
 import threading
+from dataclasses import fields, replace
+from collections import defaultdict
 
-from models import Timetable, Subject, ClassSession, TimeSlot, WEEKDAYS, COMMON_TIME_SLOTS, SESSION_TYPES, SUBJECT_COLORS
-from data_manager import DataManager
+from models import (Timetable, Subject, ClassSession, TimeSlot, WEEKDAYS, COMMON_TIME_SLOTS,
+                    TIME_SLOT_LABELS, TIME_SLOT_BY_LABEL, SESSION_TYPES, SUBJECT_COLORS)
+from data_manager import BufferedDataManager
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("dark")  # Modes: "System" (standard), "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
 
+# Delay before queued timetable changes are written when auto-save is enabled
+AUTO_SAVE_DELAY_MS = 500
+
+# Bind tags shared by every weekly grid cell and every widget inside a session
+GRID_CELL_TAG = "GridCellTag"
+SESSION_TAG = "SessionTag"
+
+
+def center_dialog(dialog, parent, width: int, height: int):
+    """Size a dialog and place it over its parent with a single geometry call"""
+    x = parent.winfo_rootx() + 50
+    y = parent.winfo_rooty() + 50
+    dialog.geometry(f"{width}x{height}+{x}+{y}")
+
+
+def add_bindtag(widget, tag: str):
+    """Route events on a widget and all its descendants through a bind tag"""
+    widget.bindtags((tag,) + widget.bindtags())
+    # CTkFrame.winfo_children hides the frame's own background canvas, which
+    # covers the whole frame and receives its clicks, so ask Tk directly
+    for child in tk.Misc.winfo_children(widget):
+        add_bindtag(child, tag)
+
+
 class ModernTimetableApp:
+    # Toolbar buttons as (text, method name, width)
+    TOOLBAR_LEFT = (
+        ("📋 New Timetable", "new_timetable", 120),
+        ("📂 Open", "open_timetable", 80),
+        ("💾 Save", "save_timetable", 80),
+    )
+    TOOLBAR_RIGHT = (
+        ("➕ Add Class", "add_class_dialog", 100),
+        ("📚 Subjects", "manage_subjects_dialog", 100),
+        ("⚙️ Settings", "settings_dialog", 100),
+    )
+    
     def __init__(self):
         self.root = ctk.CTk()
         self.root.title("Timetable Management System")
@@ -23,14 +62,26 @@ class ModernTimetableApp:
         self.root.minsize(1000, 600)
         
         # Initialize data manager
-        self.data_manager = DataManager()
+        self.data_manager = BufferedDataManager()
+        self._auto_save_after_id = None
+        self._status_after_id = None
+        # Reusable dialogs by class, hidden between uses
+        self._dialog_cache: Dict[type, "ReusableDialog"] = {}
         self.current_timetable: Optional[Timetable] = None
+        # Whether the current timetable has changes that have not been written
+        self._timetable_dirty = False
+        self._session_index: Optional[Dict[tuple, ClassSession]] = None
         self.subjects: List[Subject] = self.data_manager.load_subjects()
+        self._color_cache: Dict[str, tuple] = {}
+        self.build_color_cache()
         self.settings = self.data_manager.load_settings()
         
         # Apply settings
         self.apply_settings()
         
+        # Fonts are shared by all widgets instead of created per widget
+        self.create_fonts()
+        
         # Create main interface
         self.create_widgets()
         self.create_menu()
@@ -46,6 +97,33 @@ class ModernTimetableApp:
         geometry = self.settings.get('window_geometry', '1400x900')
         self.root.geometry(geometry)
     
+    def build_color_cache(self):
+        """Resolve each subject color to the (light, dark) pair used by session widgets"""
+        for subject in self.subjects:
+            self.session_color(subject.color)
+    
+    def session_color(self, color: str) -> tuple:
+        """Get the cached (light, dark) color pair for a subject color"""
+        pair = self._color_cache.get(color)
+        if pair is None:
+            # Subject colors look the same in light and dark mode
+            pair = self._color_cache[color] = (color, color)
+        return pair
+    
+    def create_fonts(self):
+        """Create the fonts used across the main window"""
+        self.font_9 = ctk.CTkFont(size=9)
+        self.font_10 = ctk.CTkFont(size=10)
+        self.font_11 = ctk.CTkFont(size=11)
+        self.font_12 = ctk.CTkFont(size=12)
+        self.font_14 = ctk.CTkFont(size=14)
+        self.font_16 = ctk.CTkFont(size=16)
+        self.font_bold = ctk.CTkFont(weight="bold")
+        self.font_bold_12 = ctk.CTkFont(weight="bold", size=12)
+        self.font_bold_16 = ctk.CTkFont(weight="bold", size=16)
+        self.font_bold_18 = ctk.CTkFont(weight="bold", size=18)
+        self.font_bold_20 = ctk.CTkFont(weight="bold", size=20)
+    
     def create_widgets(self):
         """Create the main interface widgets"""
         # Create main container
@@ -70,12 +148,9 @@ class ModernTimetableApp:
         left_frame = ctk.CTkFrame(self.toolbar)
         left_frame.pack(side="left", fill="y", padx=5, pady=5)
         
-        ctk.CTkButton(left_frame, text="📋 New Timetable", 
-                     command=self.new_timetable, width=120).pack(side="left", padx=5)
-        ctk.CTkButton(left_frame, text="📂 Open", 
-                     command=self.open_timetable, width=80).pack(side="left", padx=5)
-        ctk.CTkButton(left_frame, text="💾 Save", 
-                     command=self.save_timetable, width=80).pack(side="left", padx=5)
+        for text, method_name, width in self.TOOLBAR_LEFT:
+            ctk.CTkButton(left_frame, text=text, 
+                         command=getattr(self, method_name), width=width).pack(side="left", padx=5)
         
         # Middle - Timetable selector
         middle_frame = ctk.CTkFrame(self.toolbar)
@@ -91,16 +166,13 @@ class ModernTimetableApp:
         right_frame = ctk.CTkFrame(self.toolbar)
         right_frame.pack(side="right", fill="y", padx=5, pady=5)
         
-        ctk.CTkButton(right_frame, text="➕ Add Class", 
-                     command=self.add_class_dialog, width=100).pack(side="right", padx=5)
-        ctk.CTkButton(right_frame, text="📚 Subjects", 
-                     command=self.manage_subjects_dialog, width=100).pack(side="right", padx=5)
-        ctk.CTkButton(right_frame, text="⚙️ Settings", 
-                     command=self.settings_dialog, width=100).pack(side="right", padx=5)
+        for text, method_name, width in self.TOOLBAR_RIGHT:
+            ctk.CTkButton(right_frame, text=text, 
+                         command=getattr(self, method_name), width=width).pack(side="right", padx=5)
     
     def create_main_content(self):
         """Create the main content area with tabview"""
-        self.tabview = ctk.CTkTabview(self.main_container)
+        self.tabview = ctk.CTkTabview(self.main_container, command=self.on_tab_change)
         self.tabview.pack(fill="both", expand=True, padx=5, pady=5)
         
         # Create tabs
@@ -108,10 +180,23 @@ class ModernTimetableApp:
         self.tabview.add("📋 Daily View") 
         self.tabview.add("📊 Overview")
         
-        # Setup tab content
+        # Setup tab content; the other tabs are built when first shown
+        self._daily_built = False
+        self._overview_built = False
         self.setup_weekly_view()
-        self.setup_daily_view()
-        self.setup_overview()
+    
+    def on_tab_change(self):
+        """Build the daily view or overview the first time its tab is shown"""
+        current_tab = self.tabview.get()
+        if current_tab == "📋 Daily View" and not self._daily_built:
+            self.setup_daily_view()
+        elif current_tab == "📊 Overview" and not self._overview_built:
+            self.setup_overview()
+    
+    def show_tab(self, name: str):
+        """Switch to a tab, building its content if needed"""
+        self.tabview.set(name)
+        self.on_tab_change()
     
     def setup_weekly_view(self):
         """Setup the weekly timetable view"""
@@ -121,40 +206,83 @@ class ModernTimetableApp:
         self.weekly_scroll = ctk.CTkScrollableFrame(weekly_frame)
         self.weekly_scroll.pack(fill="both", expand=True, padx=10, pady=10)
         
+        self.no_data_label = ctk.CTkLabel(self.weekly_scroll, 
+                                        text="No timetable loaded. Create a new one or open an existing timetable.",
+                                        font=self.font_16)
+        
+        # Grid widgets are built once and recycled on every refresh
+        self.header_frame = None
+        self.grid_frame = None
+        self._cell_frames: Dict[tuple, ctk.CTkFrame] = {}
+        self._cell_keys: Dict[ctk.CTkFrame, tuple] = {}
+        # Session widgets, created on first use and reconfigured on later refreshes
+        self._session_widgets: Dict[tuple, tuple] = {}
+        self._grid_days: tuple = ()
+        
+        # Cells and session widgets share class bindings instead of binding each widget
+        self.root.bind_class(GRID_CELL_TAG, "<Button-1>", self.on_grid_cell_click)
+        self.root.bind_class(SESSION_TAG, "<Button-3>", self.on_session_right_click)
+        self.root.bind_class(SESSION_TAG, "<Double-Button-1>", self.on_session_double_click)
+        
         # Create timetable grid
         self.create_timetable_grid()
     
+    @staticmethod
+    def _cell_key(day: str, time_slot: TimeSlot) -> tuple:
+        """Key identifying a weekly grid cell"""
+        return (day, time_slot.start_time, time_slot.end_time)
+    
     def create_timetable_grid(self):
         """Create the visual timetable grid"""
-        # Clear existing widgets
-        for widget in self.weekly_scroll.winfo_children():
-            widget.destroy()
-        
         if not self.current_timetable:
-            no_data_label = ctk.CTkLabel(self.weekly_scroll, 
-                                       text="No timetable loaded. Create a new one or open an existing timetable.",
-                                       font=ctk.CTkFont(size=16))
-            no_data_label.pack(expand=True, fill="both", padx=20, pady=50)
+            if self.grid_frame is not None:
+                self.header_frame.pack_forget()
+                self.grid_frame.pack_forget()
+            self.no_data_label.pack(expand=True, fill="both", padx=20, pady=50)
             return
         
+        self.no_data_label.pack_forget()
+        
+        # Only rebuild the skeleton when the visible columns change
+        show_weekend = self.settings.get('show_weekend', False)
+        visible_days = tuple(day for day in WEEKDAYS if show_weekend or day != 'Saturday')
+        if self.grid_frame is None or visible_days != self._grid_days:
+            self.build_grid_skeleton(visible_days)
+        else:
+            self.header_frame.pack(fill="x", padx=5, pady=5)
+            self.grid_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        # Fill each cell with its session
+        for time_slot in COMMON_TIME_SLOTS:
+            for day in visible_days:
+                self.rebind_cell(day, time_slot)
+    
+    def build_grid_skeleton(self, visible_days: tuple):
+        """Build the header, time labels and empty cell frames of the weekly grid"""
+        if self.grid_frame is not None:
+            self.header_frame.destroy()
+            self.grid_frame.destroy()
+        self._cell_frames.clear()
+        self._cell_keys.clear()
+        self._session_widgets.clear()
+        self._grid_days = visible_days
+        
         # Create header
-        header_frame = ctk.CTkFrame(self.weekly_scroll)
-        header_frame.pack(fill="x", padx=5, pady=5)
+        self.header_frame = ctk.CTkFrame(self.weekly_scroll)
+        self.header_frame.pack(fill="x", padx=5, pady=5)
         
         # Time column header
-        ctk.CTkLabel(header_frame, text="Time", font=ctk.CTkFont(weight="bold")).grid(
+        ctk.CTkLabel(self.header_frame, text="Time", font=self.font_bold).grid(
             row=0, column=0, padx=5, pady=5, sticky="nsew")
         
         # Day headers
-        for i, day in enumerate(WEEKDAYS):
-            if not self.settings.get('show_weekend', False) and day == 'Saturday':
-                continue
-            ctk.CTkLabel(header_frame, text=day, font=ctk.CTkFont(weight="bold")).grid(
+        for i, day in enumerate(visible_days):
+            ctk.CTkLabel(self.header_frame, text=day, font=self.font_bold).grid(
                 row=0, column=i+1, padx=5, pady=5, sticky="nsew")
         
         # Configure grid weights
-        for i in range(len(WEEKDAYS) + 1):
-            header_frame.grid_columnconfigure(i, weight=1)
+        for i in range(len(visible_days) + 1):
+            self.header_frame.grid_columnconfigure(i, weight=1)
         
         # Create time slots and class grid
         self.grid_frame = ctk.CTkFrame(self.weekly_scroll)
@@ -166,78 +294,144 @@ class ModernTimetableApp:
             time_frame = ctk.CTkFrame(self.grid_frame)
             time_frame.grid(row=row, column=0, padx=2, pady=2, sticky="nsew")
             ctk.CTkLabel(time_frame, text=str(time_slot), 
-                        font=ctk.CTkFont(size=12)).pack(expand=True, fill="both")
+                        font=self.font_12).pack(expand=True, fill="both")
             
             # Day columns
-            for col, day in enumerate(WEEKDAYS):
-                if not self.settings.get('show_weekend', False) and day == 'Saturday':
-                    continue
-                
-                cell_frame = ctk.CTkFrame(self.grid_frame)
+            for col, day in enumerate(visible_days):
+                # Empty cells are clickable to add a class through GRID_CELL_TAG
+                cell_frame = ctk.CTkFrame(self.grid_frame, height=60)
                 cell_frame.grid(row=row, column=col+1, padx=2, pady=2, sticky="nsew")
-                
-                # Find session for this time and day
-                session = self.find_session(day, time_slot)
-                if session:
-                    self.create_session_widget(cell_frame, session)
-                else:
-                    # Empty cell - clickable to add class
-                    empty_label = ctk.CTkLabel(cell_frame, text="", height=60)
-                    empty_label.pack(expand=True, fill="both")
-                    empty_label.bind("<Button-1>", 
-                                   lambda e, d=day, t=time_slot: self.add_class_at_time(d, t))
+                add_bindtag(cell_frame, GRID_CELL_TAG)
+                self._cell_frames[self._cell_key(day, time_slot)] = cell_frame
+                self._cell_keys[cell_frame] = self._cell_key(day, time_slot)
         
         # Configure grid weights
-        for i in range(len(WEEKDAYS) + 1):
+        for i in range(len(visible_days) + 1):
             self.grid_frame.grid_columnconfigure(i, weight=1)
         for i in range(len(COMMON_TIME_SLOTS)):
             self.grid_frame.grid_rowconfigure(i, weight=1)
     
+    def update_cell(self, day: str, time_slot: TimeSlot):
+        """Redraw a single grid cell if it is part of the weekly grid"""
+        if self._cell_key(day, time_slot) in self._cell_frames:
+            self.rebind_cell(day, time_slot)
+    
+    def rebind_cell(self, day: str, time_slot: TimeSlot):
+        """Show the session scheduled at the given day and time in its grid cell"""
+        key = self._cell_key(day, time_slot)
+        cell_frame = self._cell_frames[key]
+        session_widgets = self._session_widgets.get(key)
+        
+        # Find session for this time and day
+        session = self.find_session(day, time_slot)
+        if session:
+            if session_widgets is None:
+                session_widgets = self._session_widgets[key] = self.create_session_widget(cell_frame)
+            self.show_session_widget(session_widgets, session)
+        elif session_widgets is not None:
+            # Leave the bare cell frame, which handles clicks to add a class
+            session_widgets[0].pack_forget()
+    
     def find_session(self, day: str, time_slot: TimeSlot) -> Optional[ClassSession]:
         """Find a session for given day and time"""
         if not self.current_timetable:
             return None
         
-        for session in self.current_timetable.sessions:
-            if (session.day == day and 
-                session.time_slot.start_time == time_slot.start_time and
-                session.time_slot.end_time == time_slot.end_time):
-                return session
-        return None
-    
-    def create_session_widget(self, parent, session: ClassSession):
-        """Create a widget for a class session"""
-        # Session frame with subject color
-        session_frame = ctk.CTkFrame(parent, fg_color=session.subject.color, height=60)
-        session_frame.pack(expand=True, fill="both", padx=2, pady=2)
+        if self._session_index is None:
+            self.build_session_index()
+        return self._session_index.get(self._cell_key(day, time_slot))
+    
+    def build_session_index(self):
+        """Index the current timetable's sessions by grid cell"""
+        self._session_index = {}
+        if self.current_timetable:
+            for session in self.current_timetable.sessions:
+                # Keep the first session when several share a cell
+                self._session_index.setdefault(self._cell_key(session.day, session.time_slot), session)
+    
+    def create_session_widget(self, parent) -> tuple:
+        """Create the frame and labels used to show a class session in a grid cell"""
+        # Session frame, colored per subject in show_session_widget
+        session_frame = ctk.CTkFrame(parent, height=60)
         
         # Subject info
-        subject_label = ctk.CTkLabel(session_frame, text=session.subject.code,
-                                   font=ctk.CTkFont(weight="bold", size=12),
+        subject_label = ctk.CTkLabel(session_frame, text="",
+                                   font=self.font_bold_12,
                                    text_color="white")
         subject_label.pack(anchor="n", pady=(5, 0))
         
-        room_label = ctk.CTkLabel(session_frame, text=session.room,
-                                font=ctk.CTkFont(size=10),
+        room_label = ctk.CTkLabel(session_frame, text="",
+                                font=self.font_10,
                                 text_color="white")
         room_label.pack(anchor="n")
         
-        type_label = ctk.CTkLabel(session_frame, text=session.session_type,
-                                font=ctk.CTkFont(size=9),
+        type_label = ctk.CTkLabel(session_frame, text="",
+                                font=self.font_9,
                                 text_color="white")
         type_label.pack(anchor="n")
         
-        # Right-click context menu
-        session_frame.bind("<Button-3>", lambda e: self.show_session_context_menu(e, session))
-        subject_label.bind("<Button-3>", lambda e: self.show_session_context_menu(e, session))
-        room_label.bind("<Button-3>", lambda e: self.show_session_context_menu(e, session))
-        type_label.bind("<Button-3>", lambda e: self.show_session_context_menu(e, session))
+        # Right-click and double-click are handled by the SESSION_TAG class bindings
+        add_bindtag(session_frame, SESSION_TAG)
+        
+        return session_frame, subject_label, room_label, type_label
+    
+    def show_session_widget(self, session_widgets: tuple, session: ClassSession):
+        """Update a cell's session widgets in place to show the given session"""
+        session_frame, subject_label, room_label, type_label = session_widgets
+        
+        # Only touch options that changed, since each configure redraws the widget
+        fg_color = self.session_color(session.subject.color)
+        if session_frame.cget("fg_color") is not fg_color:
+            session_frame.configure(fg_color=fg_color)
+        for label, text in ((subject_label, session.subject.code),
+                            (room_label, session.room),
+                            (type_label, session.session_type)):
+            if label.cget("text") != text:
+                label.configure(text=text)
+        
+        if not session_frame.winfo_manager():
+            session_frame.pack(expand=True, fill="both", padx=2, pady=2)
+    
+    def cell_from_event(self, event) -> Optional[tuple]:
+        """Find the key of the grid cell an event happened in"""
+        widget = event.widget
+        while widget is not None and widget not in self._cell_keys:
+            widget = getattr(widget, 'master', None)
+        return self._cell_keys.get(widget)
+    
+    def session_from_event(self, event) -> Optional[ClassSession]:
+        """Find the session shown in the grid cell an event happened in"""
+        key = self.cell_from_event(event)
+        if key is None or self._session_index is None:
+            return None
+        return self._session_index.get(key)
+    
+    def on_grid_cell_click(self, event):
+        """Add a class at the time of the empty grid cell that was clicked"""
+        key = self.cell_from_event(event)
+        if key is None:
+            return
         
-        # Double-click to edit
-        session_frame.bind("<Double-Button-1>", lambda e: self.edit_session_dialog(session))
+        day, start_time, end_time = key
+        time_slot = TimeSlot(start_time, end_time)
+        if self.find_session(day, time_slot) is None:
+            self.add_class_at_time(day, time_slot)
+    
+    def on_session_right_click(self, event):
+        """Show the context menu for the session under the pointer"""
+        session = self.session_from_event(event)
+        if session:
+            self.show_session_context_menu(event, session)
+    
+    def on_session_double_click(self, event):
+        """Edit the session under the pointer"""
+        session = self.session_from_event(event)
+        if session:
+            self.edit_session_dialog(session)
     
     def setup_daily_view(self):
         """Setup the daily view tab"""
+        self._daily_built = True
         daily_frame = self.tabview.tab("📋 Daily View")
         
         # Day selector
@@ -245,7 +439,7 @@ class ModernTimetableApp:
         day_selector_frame.pack(fill="x", padx=10, pady=10)
         
         ctk.CTkLabel(day_selector_frame, text="Select Day:", 
-                    font=ctk.CTkFont(weight="bold")).pack(side="left", padx=10)
+                    font=self.font_bold).pack(side="left", padx=10)
         
         self.selected_day = ctk.StringVar(value="Monday")
         day_menu = ctk.CTkOptionMenu(day_selector_frame, variable=self.selected_day,
@@ -296,9 +490,9 @@ class ModernTimetableApp:
         left_frame.pack_propagate(False)
         
         ctk.CTkLabel(left_frame, text=str(session.time_slot),
-                    font=ctk.CTkFont(weight="bold", size=16)).pack(pady=5)
+                    font=self.font_bold_16).pack(pady=5)
         ctk.CTkLabel(left_frame, text=session.session_type,
-                    font=ctk.CTkFont(size=12)).pack()
+                    font=self.font_12).pack()
         
         # Right side - Subject details
         right_frame = ctk.CTkFrame(card)
@@ -309,9 +503,9 @@ class ModernTimetableApp:
         subject_frame.pack(fill="x", pady=5)
         
         ctk.CTkLabel(subject_frame, text=session.subject.name,
-                    font=ctk.CTkFont(weight="bold", size=18)).pack(anchor="w", padx=10, pady=5)
+                    font=self.font_bold_18).pack(anchor="w", padx=10, pady=5)
         ctk.CTkLabel(subject_frame, text=f"Code: {session.subject.code}",
-                    font=ctk.CTkFont(size=12)).pack(anchor="w", padx=10)
+                    font=self.font_12).pack(anchor="w", padx=10)
         
         # Details frame
         details_frame = ctk.CTkFrame(right_frame)
@@ -322,7 +516,7 @@ class ModernTimetableApp:
             details_text += f"\nNotes: {session.notes}"
         
         ctk.CTkLabel(details_frame, text=details_text,
-                    font=ctk.CTkFont(size=11), justify="left").pack(anchor="w", padx=10, pady=5)
+                    font=self.font_11, justify="left").pack(anchor="w", padx=10, pady=5)
         
         # Action buttons
         button_frame = ctk.CTkFrame(right_frame)
@@ -335,6 +529,7 @@ class ModernTimetableApp:
     
     def setup_overview(self):
         """Setup the overview tab with statistics"""
+        self._overview_built = True
         overview_frame = self.tabview.tab("📊 Overview")
         
         # Create overview content
@@ -359,21 +554,22 @@ class ModernTimetableApp:
         info_frame.pack(fill="x", padx=10, pady=10)
         
         ctk.CTkLabel(info_frame, text=f"Timetable: {self.current_timetable.name}",
-                    font=ctk.CTkFont(weight="bold", size=20)).pack(pady=10)
+                    font=self.font_bold_20).pack(pady=10)
         ctk.CTkLabel(info_frame, text=f"Semester: {self.current_timetable.semester}",
-                    font=ctk.CTkFont(size=14)).pack(pady=5)
+                    font=self.font_14).pack(pady=5)
         ctk.CTkLabel(info_frame, text=f"Total Classes: {len(self.current_timetable.sessions)}",
-                    font=ctk.CTkFont(size=14)).pack(pady=5)
+                    font=self.font_14).pack(pady=5)
         
         # Subject statistics
         stats_frame = ctk.CTkFrame(self.overview_scroll)
         stats_frame.pack(fill="x", padx=10, pady=10)
         
         ctk.CTkLabel(stats_frame, text="Subject Statistics",
-                    font=ctk.CTkFont(weight="bold", size=16)).pack(pady=10)
+                    font=self.font_bold_16).pack(pady=10)
         
-        # Count sessions by subject
+        # Count sessions by subject and day, and total credits, in a single pass
         subject_counts = {}
+        day_counts = defaultdict(int)
         total_credits = 0
         for session in self.current_timetable.sessions:
             subject_code = session.subject.code
@@ -382,40 +578,34 @@ class ModernTimetableApp:
                     'count': 0,
                     'subject': session.subject
                 }
-            subject_counts[subject_code]['count'] += 1
-            
-        # Calculate total credits (avoid duplicates)
-        unique_subjects = set()
-        for session in self.current_timetable.sessions:
-            if session.subject.code not in unique_subjects:
+                # Credits are counted once per unique subject
                 total_credits += session.subject.credits
-                unique_subjects.add(session.subject.code)
+            subject_counts[subject_code]['count'] += 1
+            day_counts[session.day.lower()] += 1
         
         ctk.CTkLabel(stats_frame, text=f"Total Credits: {total_credits}",
-                    font=ctk.CTkFont(size=14)).pack(pady=5)
+                    font=self.font_14).pack(pady=5)
         
-        # Subject breakdown
-        for subject_code, data in subject_counts.items():
-            subject_info = ctk.CTkFrame(stats_frame)
-            subject_info.pack(fill="x", padx=10, pady=5)
-            
-            info_text = f"{data['subject'].name} ({subject_code}): {data['count']} classes"
-            ctk.CTkLabel(subject_info, text=info_text).pack(anchor="w", padx=10, pady=5)
+        # Subject breakdown, one line per subject
+        if subject_counts:
+            breakdown_text = "\n".join(
+                f"{data['subject'].name} ({subject_code}): {data['count']} classes"
+                for subject_code, data in subject_counts.items()
+            )
+            ctk.CTkLabel(stats_frame, text=breakdown_text, justify="left",
+                        anchor="w").pack(fill="x", padx=20, pady=5)
         
         # Weekly distribution
         weekly_frame = ctk.CTkFrame(self.overview_scroll)
         weekly_frame.pack(fill="x", padx=10, pady=10)
         
         ctk.CTkLabel(weekly_frame, text="Weekly Distribution",
-                    font=ctk.CTkFont(weight="bold", size=16)).pack(pady=10)
+                    font=self.font_bold_16).pack(pady=10)
         
-        for day in WEEKDAYS:
-            day_sessions = self.current_timetable.get_sessions_by_day(day)
-            day_info = ctk.CTkFrame(weekly_frame)
-            day_info.pack(fill="x", padx=10, pady=2)
-            
-            ctk.CTkLabel(day_info, text=f"{day}: {len(day_sessions)} classes",
-                        font=ctk.CTkFont(size=12)).pack(anchor="w", padx=10, pady=3)
+        # One line per weekday
+        distribution_text = "\n".join(f"{day}: {day_counts[day.lower()]} classes" for day in WEEKDAYS)
+        ctk.CTkLabel(weekly_frame, text=distribution_text, font=self.font_12,
+                    justify="left", anchor="w").pack(fill="x", padx=20, pady=5)
     
     def create_status_bar(self):
         """Create the status bar"""
@@ -428,14 +618,18 @@ class ModernTimetableApp:
         self.status_label.pack(side="left", padx=10, pady=5)
         
         # Right side - current time
-        self.time_label = ctk.CTkLabel(self.status_bar, text="")
+        self.time_text = ctk.StringVar(value="")
+        self.time_label = ctk.CTkLabel(self.status_bar, textvariable=self.time_text)
         self.time_label.pack(side="right", padx=10, pady=5)
         self.update_time()
     
     def update_time(self):
         """Update the current time display"""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.time_label.configure(text=current_time)
+        # Nothing to show while the window is minimized or hidden
+        if self.root.state() != 'iconic' and self.root.winfo_viewable():
+            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            if current_time != self.time_text.get():
+                self.time_text.set(current_time)
         self.root.after(1000, self.update_time)
     
     def create_menu(self):
@@ -467,20 +661,32 @@ class ModernTimetableApp:
         # View menu
         view_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_command(label="Weekly View", command=lambda: self.tabview.set("📅 Weekly View"))
-        view_menu.add_command(label="Daily View", command=lambda: self.tabview.set("📋 Daily View"))
-        view_menu.add_command(label="Overview", command=lambda: self.tabview.set("📊 Overview"))
+        view_menu.add_command(label="Weekly View", command=lambda: self.show_tab("📅 Weekly View"))
+        view_menu.add_command(label="Daily View", command=lambda: self.show_tab("📋 Daily View"))
+        view_menu.add_command(label="Overview", command=lambda: self.show_tab("📊 Overview"))
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="About", command=self.show_about)
+        
+        # Session context menu, shared by all session widgets
+        self._context_session: Optional[ClassSession] = None
+        self.session_context_menu = tk.Menu(self.root, tearoff=0)
+        self.session_context_menu.add_command(
+            label="Edit", command=lambda: self.edit_session_dialog(self._context_session))
+        self.session_context_menu.add_command(
+            label="Delete", command=lambda: self.delete_session(self._context_session))
+        self.session_context_menu.add_separator()
+        self.session_context_menu.add_command(
+            label="View Details", command=lambda: self.show_session_details(self._context_session))
     
     def new_timetable(self):
         """Create a new timetable"""
         dialog = NewTimetableDialog(self.root, self.data_manager)
         if dialog.result:
             self.current_timetable = dialog.result
+            self._timetable_dirty = True
             self.timetable_var.set(self.current_timetable.name)
             self.refresh_all_views()
             self.set_status(f"Created new timetable: {self.current_timetable.name}")
@@ -490,6 +696,7 @@ class ModernTimetableApp:
         dialog = OpenTimetableDialog(self.root, self.data_manager)
         if dialog.result:
             self.current_timetable = dialog.result
+            self._timetable_dirty = False
             self.timetable_var.set(self.current_timetable.name)
             self.refresh_all_views()
             self.set_status(f"Opened timetable: {self.current_timetable.name}")
@@ -502,6 +709,11 @@ class ModernTimetableApp:
         
         success = self.data_manager.save_timetable(self.current_timetable)
         if success:
+            self._timetable_dirty = False
+            # The save also wrote any queued auto-save of this timetable
+            if self._auto_save_after_id and not self.data_manager.has_pending_changes():
+                self.root.after_cancel(self._auto_save_after_id)
+                self._auto_save_after_id = None
             self.set_status(f"Saved timetable: {self.current_timetable.name}")
             messagebox.showinfo("Success", "Timetable saved successfully!")
         else:
@@ -513,10 +725,11 @@ class ModernTimetableApp:
             messagebox.showwarning("Warning", "Please create or open a timetable first!")
             return
         
-        dialog = AddClassDialog(self.root, self.subjects)
+        dialog = self.open_dialog(AddClassDialog, self.subjects)
         if dialog.result:
             self.current_timetable.add_session(dialog.result)
-            self.refresh_all_views()
+            self.schedule_auto_save()
+            self.refresh_sessions(dialog.result)
             self.set_status("Added new class session")
     
     def add_class_at_time(self, day: str, time_slot: TimeSlot):
@@ -525,20 +738,25 @@ class ModernTimetableApp:
             messagebox.showwarning("Warning", "Please create or open a timetable first!")
             return
         
-        dialog = AddClassDialog(self.root, self.subjects, day, time_slot)
+        dialog = self.open_dialog(AddClassDialog, self.subjects, day, time_slot)
         if dialog.result:
             self.current_timetable.add_session(dialog.result)
-            self.refresh_all_views()
+            self.schedule_auto_save()
+            self.refresh_sessions(dialog.result)
             self.set_status(f"Added class on {day} at {time_slot}")
     
     def edit_session_dialog(self, session: ClassSession):
         """Edit an existing session"""
-        dialog = EditClassDialog(self.root, self.subjects, session)
+        dialog = self.open_dialog(EditClassDialog, self.subjects, session)
         if dialog.result:
             # Remove old session and add updated one
             self.current_timetable.remove_session(session)
             self.current_timetable.add_session(dialog.result)
-            self.refresh_all_views()
+            self.schedule_auto_save()
+            # The overview only depends on subjects and days
+            counts_changed = (session.subject != dialog.result.subject or
+                              session.day != dialog.result.day)
+            self.refresh_sessions(session, dialog.result, counts_changed=counts_changed)
             self.set_status("Updated class session")
     
     def delete_session(self, session: ClassSession):
@@ -546,38 +764,51 @@ class ModernTimetableApp:
         if messagebox.askyesno("Confirm Delete", 
                               f"Are you sure you want to delete {session.subject.name} class?"):
             self.current_timetable.remove_session(session)
-            self.refresh_all_views()
+            self.schedule_auto_save()
+            self.refresh_sessions(session)
             self.set_status("Deleted class session")
     
     def manage_subjects_dialog(self):
         """Open dialog to manage subjects"""
-        dialog = ManageSubjectsDialog(self.root, self.subjects, self.data_manager)
+        dialog = self.open_dialog(ManageSubjectsDialog, self.subjects, self.data_manager)
         if dialog.subjects_modified:
             self.subjects = dialog.subjects
+            self.build_color_cache()
+            # Sessions may share the edited Subject objects
+            if self.current_timetable:
+                self.current_timetable.rebuild_indices()
+                self.current_timetable.mark_modified()
+                self.schedule_auto_save()
             self.refresh_all_views()
             self.set_status("Updated subjects")
     
     def settings_dialog(self):
         """Open settings dialog"""
-        dialog = SettingsDialog(self.root, self.settings, self.data_manager)
+        dialog = self.open_dialog(SettingsDialog, self.settings, self.data_manager)
         if dialog.settings_modified:
             self.settings = dialog.settings
             self.apply_settings()
             self.refresh_all_views()
             self.set_status("Settings updated")
     
+    def open_dialog(self, dialog_class, *args):
+        """Show a reusable dialog, building it only on first use, and wait for it to close"""
+        dialog = self._dialog_cache.get(dialog_class)
+        if dialog is None or not dialog.reset(*args):
+            if dialog is not None:
+                dialog.dialog.destroy()
+            dialog = self._dialog_cache[dialog_class] = dialog_class(self.root, *args)
+        dialog.show()
+        return dialog
+    
     def show_session_context_menu(self, event, session: ClassSession):
         """Show context menu for a session"""
-        context_menu = tk.Menu(self.root, tearoff=0)
-        context_menu.add_command(label="Edit", command=lambda: self.edit_session_dialog(session))
-        context_menu.add_command(label="Delete", command=lambda: self.delete_session(session))
-        context_menu.add_separator()
-        context_menu.add_command(label="View Details", command=lambda: self.show_session_details(session))
+        self._context_session = session
         
         try:
-            context_menu.tk_popup(event.x_root, event.y_root)
+            self.session_context_menu.tk_popup(event.x_root, event.y_root)
         finally:
-            context_menu.grab_release()
+            self.session_context_menu.grab_release()
     
     def show_session_details(self, session: ClassSession):
         """Show detailed information about a session"""
@@ -604,6 +835,7 @@ Notes: {session.notes}"""
             timetable = self.data_manager.import_from_json(file_path)
             if timetable:
                 self.current_timetable = timetable
+                self._timetable_dirty = True
                 self.timetable_var.set(self.current_timetable.name)
                 self.refresh_all_views()
                 self.set_status(f"Imported timetable from {file_path}")
@@ -675,6 +907,7 @@ Developed using Python and CustomTkinter"""
         if timetable_names:
             # Load the first available timetable
             self.current_timetable = self.data_manager.load_timetable(timetable_names[0])
+            self._timetable_dirty = False
             if self.current_timetable:
                 self.timetable_var.set(self.current_timetable.name)
                 self.refresh_all_views()
@@ -682,32 +915,88 @@ Developed using Python and CustomTkinter"""
     
     def refresh_all_views(self):
         """Refresh all views with current data"""
+        self.build_session_index()
         self.create_timetable_grid()
-        self.update_daily_view()
-        self.update_overview()
+        if self._daily_built:
+            self.update_daily_view()
+        if self._overview_built:
+            self.update_overview()
+    
+    def refresh_sessions(self, *sessions: ClassSession, counts_changed: bool = True):
+        """Refresh only the parts of the views affected by the given sessions"""
+        self.build_session_index()
+        for session in sessions:
+            self.update_cell(session.day, session.time_slot)
+        
+        if self._daily_built and self.selected_day.get() in {session.day for session in sessions}:
+            self.update_daily_view()
+        if self._overview_built and counts_changed:
+            self.update_overview()
     
     def set_status(self, message: str):
         """Set status bar message"""
         self.status_text.set(message)
         
-        # Clear status after 5 seconds
-        def clear_status():
-            self.status_text.set("Ready")
+        # Clear status after 5 seconds, restarting the timer for each new message
+        if self._status_after_id:
+            self.root.after_cancel(self._status_after_id)
+        self._status_after_id = self.root.after(5000, self.clear_status)
+    
+    def clear_status(self):
+        """Reset the status bar message"""
+        self._status_after_id = None
+        self.status_text.set("Ready")
+    
+    def schedule_auto_save(self):
+        """Queue the current timetable for a deferred save if auto-save is enabled"""
+        self._timetable_dirty = True
+        if not self.settings.get('auto_save', True) or not self.current_timetable:
+            return
+        
+        self.data_manager.mark_dirty(self.current_timetable)
         
-        self.root.after(5000, clear_status)
+        # Restart the timer so a burst of edits results in a single write
+        if self._auto_save_after_id:
+            self.root.after_cancel(self._auto_save_after_id)
+        self._auto_save_after_id = self.root.after(AUTO_SAVE_DELAY_MS, self.flush_auto_save)
+    
+    def flush_auto_save(self):
+        """Write any timetables queued by auto-save"""
+        self._auto_save_after_id = None
+        if self.data_manager.flush():
+            self._timetable_dirty = False
+        else:
+            self.set_status("Auto-save failed")
     
     def on_closing(self):
         """Handle application closing"""
-        # Save current window geometry
-        self.settings['window_geometry'] = self.root.geometry()
-        self.data_manager.save_settings(self.settings)
-        
-        # Auto-save current timetable if enabled
-        if self.settings.get('auto_save', True) and self.current_timetable:
-            self.data_manager.save_timetable(self.current_timetable)
+        # Save current window geometry if it changed
+        geometry = self.root.geometry()
+        settings = None
+        if geometry != self.settings.get('window_geometry'):
+            self.settings['window_geometry'] = geometry
+            settings = dict(self.settings)
+        
+        # Auto-save current timetable if enabled and it has unsaved changes
+        if self._auto_save_after_id:
+            self.root.after_cancel(self._auto_save_after_id)
+            self._auto_save_after_id = None
+        if self.settings.get('auto_save', True) and self.current_timetable and self._timetable_dirty:
+            self.data_manager.mark_dirty(self.current_timetable)
+        
+        # Write on a worker thread so the window closes at once; the thread is
+        # not a daemon, so the interpreter waits for it before exiting
+        if settings is not None or self.data_manager.has_pending_changes():
+            threading.Thread(target=self.write_pending_changes, args=(settings,)).start()
         
         self.root.destroy()
     
+    def write_pending_changes(self, settings: Optional[dict]):
+        """Write changed settings and queued timetables"""
+        if settings is not None:
+            self.data_manager.save_settings(settings)
+        self.data_manager.flush()
+    
     def run(self):
         """Start the application"""
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -722,12 +1011,11 @@ class NewTimetableDialog:
         
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title("Create New Timetable")
-        self.dialog.geometry("400x300")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
         # Center the dialog
-        self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
+        center_dialog(self.dialog, parent, 400, 300)
         
         self.create_widgets()
     
@@ -793,12 +1081,11 @@ class OpenTimetableDialog:
         
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title("Open Timetable")
-        self.dialog.geometry("500x400")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
         # Center the dialog
-        self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
+        center_dialog(self.dialog, parent, 500, 400)
         
         self.create_widgets()
     
@@ -811,14 +1098,11 @@ class OpenTimetableDialog:
                                   font=ctk.CTkFont(size=18, weight="bold"))
         title_label.pack(pady=20)
         
-        # Timetable list
-        self.timetable_listbox = tk.Listbox(main_frame, height=10)
-        self.timetable_listbox.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Load timetable names
+        # Timetable list; the listbox shows the names held in its list variable
         timetable_names = self.data_manager.get_timetable_names()
-        for name in timetable_names:
-            self.timetable_listbox.insert(tk.END, name)
+        self.timetable_names_var = tk.Variable(self.dialog, value=timetable_names)
+        self.timetable_listbox = tk.Listbox(main_frame, height=10, listvariable=self.timetable_names_var)
+        self.timetable_listbox.pack(fill="both", expand=True, padx=10, pady=10)
         
         if not timetable_names:
             ctk.CTkLabel(main_frame, text="No saved timetables found.").pack(pady=20)
@@ -867,25 +1151,93 @@ class OpenTimetableDialog:
         self.dialog.destroy()
 
 
-class AddClassDialog:
+class ReusableDialog:
+    """Base for dialogs that are hidden when closed and shown again on the next open"""
+    
+    def setup_window(self):
+        """Make closing the window cancel the dialog instead of destroying it"""
+        self._closed = tk.BooleanVar(self.dialog, value=False)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
+        self.dialog.bind("<Destroy>", self.on_destroy, add="+")
+    
+    def on_destroy(self, event):
+        """Stop waiting if the dialog is destroyed, e.g. when the main window closes"""
+        # Child widgets share the toplevel's bindings, so ignore their events
+        if event.widget is self.dialog:
+            self._closed.set(True)
+    
+    def reset(self, *args) -> bool:
+        """Prepare the dialog for another use, returning False if it must be rebuilt"""
+        return False
+    
+    def show(self):
+        """Show the dialog and wait until it is closed"""
+        self._closed.set(False)
+        # The main window may have moved since the dialog was last open
+        center_dialog(self.dialog, self.dialog.master, *self.size)
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        self.dialog.wait_variable(self._closed)
+    
+    def hide(self):
+        """Close the dialog, keeping its widgets for the next use"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self._closed.set(True)
+
+
+class AddClassDialog(ReusableDialog):
     def __init__(self, parent, subjects, default_day=None, default_time_slot=None):
         self.result = None
-        self.subjects = subjects
+        self.set_subjects(subjects)
         
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title("Add New Class")
-        self.dialog.geometry("500x600")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
+        self.setup_window()
         
-        # Center the dialog
-        self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
+        # Centered over the parent each time it is shown
+        self.size = (500, 600)
         
         self.default_day = default_day
         self.default_time_slot = default_time_slot
         
         self.create_widgets()
     
+    def set_subjects(self, subjects):
+        """Use a subject list, building its menu labels and lookups once"""
+        self.subjects = subjects
+        self._labels = [f"{s.code}: {s.name}" for s in subjects]
+        self._label_to_subject: Dict[str, Subject] = {}
+        self._by_code: Dict[str, Subject] = {}
+        for label, subject in zip(self._labels, subjects):
+            self._label_to_subject.setdefault(label, subject)
+            self._by_code.setdefault(subject.code, subject)
+    
+    def reset(self, subjects, default_day=None, default_time_slot=None) -> bool:
+        # Without subjects the dialog has a different layout
+        if bool(subjects) != bool(self.subjects):
+            return False
+        
+        self.result = None
+        self.default_day = default_day
+        self.default_time_slot = default_time_slot
+        if subjects is not self.subjects:
+            self.set_subjects(subjects)
+            if subjects:
+                self.subject_menu.configure(values=self._labels)
+        if self.subjects:
+            self.clear_form()
+        return True
+    
+    def clear_form(self):
+        self.subject_var.set(self._labels[0])
+        self.day_var.set(self.default_day if self.default_day else WEEKDAYS[0])
+        self.time_var.set(str(self.default_time_slot) if self.default_time_slot else TIME_SLOT_LABELS[0])
+        self.room_entry.delete(0, tk.END)
+        self.session_type_var.set(SESSION_TYPES[0])
+        self.notes_textbox.delete("1.0", tk.END)
+    
     def create_widgets(self):
         main_frame = ctk.CTkScrollableFrame(self.dialog)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
@@ -899,9 +1251,8 @@ class AddClassDialog:
         ctk.CTkLabel(main_frame, text="Subject:", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=(10, 5))
         
         if self.subjects:
-            subject_names = [f"{s.code}: {s.name}" for s in self.subjects]
-            self.subject_var = ctk.StringVar(value=subject_names[0])
-            self.subject_menu = ctk.CTkOptionMenu(main_frame, variable=self.subject_var, values=subject_names)
+            self.subject_var = ctk.StringVar(value=self._labels[0])
+            self.subject_menu = ctk.CTkOptionMenu(main_frame, variable=self.subject_var, values=self._labels)
             self.subject_menu.pack(fill="x", padx=10, pady=(0, 10))
         else:
             ctk.CTkLabel(main_frame, text="No subjects available. Please add subjects first.").pack(padx=10, pady=10)
@@ -917,10 +1268,9 @@ class AddClassDialog:
         
         # Time selection
         ctk.CTkLabel(main_frame, text="Time Slot:", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=(10, 5))
-        time_options = [str(ts) for ts in COMMON_TIME_SLOTS]
-        default_time = str(self.default_time_slot) if self.default_time_slot else time_options[0]
+        default_time = str(self.default_time_slot) if self.default_time_slot else TIME_SLOT_LABELS[0]
         self.time_var = ctk.StringVar(value=default_time)
-        time_menu = ctk.CTkOptionMenu(main_frame, variable=self.time_var, values=time_options)
+        time_menu = ctk.CTkOptionMenu(main_frame, variable=self.time_var, values=TIME_SLOT_LABELS)
         time_menu.pack(fill="x", padx=10, pady=(0, 10))
         
         # Room
@@ -952,21 +1302,22 @@ class AddClassDialog:
         
         # Get selected subject
         subject_selection = self.subject_var.get()
-        subject_code = subject_selection.split(":")[0]
-        selected_subject = None
-        for subject in self.subjects:
-            if subject.code == subject_code:
-                selected_subject = subject
-                break
+        selected_subject = self._label_to_subject.get(subject_selection)
+        if selected_subject is None:
+            # An edited session's subject may have been renamed since it was added
+            subject_code = subject_selection.split(":")[0]
+            selected_subject = self._by_code.get(subject_code)
         
         if not selected_subject:
             messagebox.showerror("Error", "Invalid subject selection!")
             return
         
-        # Parse time slot
+        # Common time slots are looked up; others, e.g. from an edited session, are parsed
         time_str = self.time_var.get()
-        start_time, end_time = time_str.split(" - ")
-        time_slot = TimeSlot(start_time, end_time)
+        time_slot = TIME_SLOT_BY_LABEL.get(time_str)
+        if time_slot is None:
+            start_time, end_time = time_str.split(" - ")
+            time_slot = TimeSlot(start_time, end_time)
         
         # Create class session
         self.result = ClassSession(
@@ -978,10 +1329,10 @@ class AddClassDialog:
             notes=self.notes_textbox.get("1.0", tk.END).strip()
         )
         
-        self.dialog.destroy()
+        self.hide()
     
     def cancel(self):
-        self.dialog.destroy()
+        self.hide()
 
 
 class EditClassDialog(AddClassDialog):
@@ -991,6 +1342,13 @@ class EditClassDialog(AddClassDialog):
         self.dialog.title("Edit Class")
         self.populate_fields()
     
+    def reset(self, subjects, session) -> bool:
+        self.session = session
+        if not super().reset(subjects):
+            return False
+        self.populate_fields()
+        return True
+    
     def populate_fields(self):
         # Set values from existing session
         subject_name = f"{self.session.subject.code}: {self.session.subject.name}"
@@ -1002,24 +1360,62 @@ class EditClassDialog(AddClassDialog):
         self.notes_textbox.insert("1.0", self.session.notes)
 
 
-class ManageSubjectsDialog:
+class ManageSubjectsDialog(ReusableDialog):
     def __init__(self, parent, subjects, data_manager):
-        self.subjects = subjects.copy()
+        # The caller's list is shared until the first change, see copy_subjects
+        self.subjects = subjects
+        self._subjects_copied = False
         self.data_manager = data_manager
         self.subjects_modified = False
+        # Codes in use, kept in sync with self.subjects for duplicate checks
+        self._codes = {subject.code for subject in self.subjects}
+        # Updates edit the shared Subject objects in place, so keep their
+        # original values by id until the changes are saved or discarded
+        self._originals: Dict[int, tuple] = {}
         
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title("Manage Subjects")
-        self.dialog.geometry("700x500")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
+        self.setup_window()
         
-        # Center the dialog
-        self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
+        # Centered over the parent each time it is shown
+        self.size = (700, 500)
         
         self.create_widgets()
         self.refresh_subjects_list()
     
+    def reset(self, subjects, data_manager) -> bool:
+        self.subjects = subjects
+        self._subjects_copied = False
+        self.data_manager = data_manager
+        self.subjects_modified = False
+        self._codes = {subject.code for subject in self.subjects}
+        self._originals = {}
+        
+        self.refresh_subjects_list()
+        self.clear_form()
+        return True
+    
+    def copy_subjects(self):
+        """Take a private copy of the subject list before its first change"""
+        if not self._subjects_copied:
+            self.subjects = list(self.subjects)
+            self._subjects_copied = True
+    
+    def discard_changes(self):
+        """Restore the subjects edited in place and forget the other changes"""
+        for subject, original in self._originals.values():
+            for f in fields(Subject):
+                setattr(subject, f.name, getattr(original, f.name))
+        self._originals.clear()
+        self.subjects_modified = False
+    
+    def on_destroy(self, event):
+        # Unsaved changes are dropped if the app closes with the dialog open
+        if event.widget is self.dialog:
+            self.discard_changes()
+        super().on_destroy(event)
+    
     def create_widgets(self):
         main_frame = ctk.CTkFrame(self.dialog)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
@@ -1039,7 +1435,9 @@ class ManageSubjectsDialog:
         
         ctk.CTkLabel(left_frame, text="Subjects:", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=5)
         
-        self.subjects_listbox = tk.Listbox(left_frame, height=15)
+        # The listbox shows the labels held in its list variable
+        self.subject_labels_var = tk.Variable(self.dialog)
+        self.subjects_listbox = tk.Listbox(left_frame, height=15, listvariable=self.subject_labels_var)
         self.subjects_listbox.pack(fill="both", expand=True, padx=10, pady=10)
         self.subjects_listbox.bind("<<ListboxSelect>>", self.on_subject_select)
         
@@ -1089,10 +1487,12 @@ class ManageSubjectsDialog:
         ctk.CTkButton(bottom_frame, text="Cancel", command=self.cancel).pack(side="right", padx=5)
         ctk.CTkButton(bottom_frame, text="Save Changes", command=self.save_changes).pack(side="right", padx=5)
     
+    @staticmethod
+    def subject_label(subject: Subject) -> str:
+        return f"{subject.code}: {subject.name}"
+    
     def refresh_subjects_list(self):
-        self.subjects_listbox.delete(0, tk.END)
-        for subject in self.subjects:
-            self.subjects_listbox.insert(tk.END, f"{subject.code}: {subject.name}")
+        self.subject_labels_var.set([self.subject_label(subject) for subject in self.subjects])
     
     def on_subject_select(self, event):
         selection = self.subjects_listbox.curselection()
@@ -1117,10 +1517,9 @@ class ManageSubjectsDialog:
             return
         
         # Check for duplicate code
-        for subject in self.subjects:
-            if subject.code == code:
-                messagebox.showerror("Error", "Subject code already exists!")
-                return
+        if code in self._codes:
+            messagebox.showerror("Error", "Subject code already exists!")
+            return
         
         try:
             credits = int(self.credits_entry.get() or "3")
@@ -1136,8 +1535,11 @@ class ManageSubjectsDialog:
             color=self.color_var.get()
         )
         
+        self.copy_subjects()
         self.subjects.append(new_subject)
-        self.refresh_subjects_list()
+        self._codes.add(code)
+        # Single-row changes edit the listbox directly instead of resetting every row
+        self.subjects_listbox.insert(tk.END, self.subject_label(new_subject))
         self.clear_form()
         self.subjects_modified = True
     
@@ -1161,13 +1563,24 @@ class ManageSubjectsDialog:
             return
         
         subject = self.subjects[selection[0]]
+        if code != subject.code:
+            if code in self._codes:
+                messagebox.showerror("Error", "Subject code already exists!")
+                return
+            self._codes.discard(subject.code)
+            self._codes.add(code)
+        
+        self.copy_subjects()
+        if id(subject) not in self._originals:
+            self._originals[id(subject)] = (subject, replace(subject))
         subject.name = name
         subject.code = code
         subject.credits = credits
         subject.instructor = self.instructor_entry.get().strip()
         subject.color = self.color_var.get()
         
-        self.refresh_subjects_list()
+        self.subjects_listbox.delete(selection[0])
+        self.subjects_listbox.insert(selection[0], self.subject_label(subject))
         self.subjects_modified = True
     
     def delete_subject(self):
@@ -1178,8 +1591,10 @@ class ManageSubjectsDialog:
         
         subject = self.subjects[selection[0]]
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete '{subject.name}'?"):
+            self.copy_subjects()
             self.subjects.pop(selection[0])
-            self.refresh_subjects_list()
+            self._codes.discard(subject.code)
+            self.subjects_listbox.delete(selection[0])
             self.clear_form()
             self.subjects_modified = True
     
@@ -1192,40 +1607,53 @@ class ManageSubjectsDialog:
     
     def save_changes(self):
         if self.subjects_modified:
-            success = self.data_manager.save_subjects(self.subjects)
-            if success:
-                messagebox.showinfo("Success", "Subjects saved successfully!")
-                self.dialog.destroy()
-            else:
-                messagebox.showerror("Error", "Failed to save subjects!")
-        else:
-            self.dialog.destroy()
+            # Write on a worker thread so the dialog closes without waiting for the disk;
+            # the thread is not a daemon, so quitting straight after still saves
+            threading.Thread(target=self.save_worker, args=(list(self.subjects),)).start()
+        self._originals.clear()
+        self.hide()
+    
+    def save_worker(self, subjects: List[Subject]):
+        if not self.data_manager.save_subjects(subjects):
+            self.dialog.after(0, lambda: messagebox.showerror("Error", "Failed to save subjects!"))
     
     def cancel(self):
         if self.subjects_modified:
             if messagebox.askyesno("Unsaved Changes", "You have unsaved changes. Are you sure you want to cancel?"):
-                self.dialog.destroy()
+                # Discarded changes must not reach the main window
+                self.discard_changes()
+                self.hide()
         else:
-            self.dialog.destroy()
+            self.hide()
 
 
-class SettingsDialog:
+class SettingsDialog(ReusableDialog):
     def __init__(self, parent, settings, data_manager):
         self.settings = settings.copy()
         self.data_manager = data_manager
         self.settings_modified = False
+        # Settings as they were on opening, to tell whether Apply changed anything
+        self._original = settings.copy()
         
         self.dialog = ctk.CTkToplevel(parent)
         self.dialog.title("Settings")
-        self.dialog.geometry("500x600")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
+        self.setup_window()
         
-        # Center the dialog
-        self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
+        # Centered over the parent each time it is shown
+        self.size = (500, 600)
         
         self.create_widgets()
     
+    def reset(self, settings, data_manager) -> bool:
+        self.settings = settings.copy()
+        self.data_manager = data_manager
+        self.settings_modified = False
+        self._original = settings.copy()
+        
+        self.load_values()
+        return True
+    
     def create_widgets(self):
         main_frame = ctk.CTkScrollableFrame(self.dialog)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
@@ -1325,21 +1753,27 @@ class SettingsDialog:
     def apply_settings(self):
         try:
             # Update settings
-            self.settings['appearance_mode'] = self.theme_var.get()
-            self.settings['color_theme'] = self.color_theme_var.get()
-            self.settings['show_weekend'] = self.show_weekend_var.get()
-            self.settings['time_format'] = self.time_format_var.get()
-            self.settings['auto_save'] = self.auto_save_var.get()
-            self.settings['default_session_duration'] = int(self.duration_entry.get())
-            self.settings['reminder_enabled'] = self.reminder_var.get()
-            self.settings['reminder_minutes'] = int(self.reminder_entry.get())
+            settings = self.settings.copy()
+            settings['appearance_mode'] = self.theme_var.get()
+            settings['color_theme'] = self.color_theme_var.get()
+            settings['show_weekend'] = self.show_weekend_var.get()
+            settings['time_format'] = self.time_format_var.get()
+            settings['auto_save'] = self.auto_save_var.get()
+            settings['default_session_duration'] = int(self.duration_entry.get())
+            settings['reminder_enabled'] = self.reminder_var.get()
+            settings['reminder_minutes'] = int(self.reminder_entry.get())
+            
+            # Nothing to save or apply if the settings are unchanged
+            if settings == self._original:
+                self.hide()
+                return
             
             # Save settings
-            success = self.data_manager.save_settings(self.settings)
+            success = self.data_manager.save_settings(settings)
             if success:
+                self.settings = settings
                 self.settings_modified = True
-                messagebox.showinfo("Success", "Settings applied successfully!")
-                self.dialog.destroy()
+                self.hide()
             else:
                 messagebox.showerror("Error", "Failed to save settings!")
         
@@ -1349,12 +1783,24 @@ class SettingsDialog:
     def reset_defaults(self):
         if messagebox.askyesno("Reset Settings", "Are you sure you want to reset all settings to defaults?"):
             self.settings = self.data_manager.get_default_settings()
-            self.dialog.destroy()
-            # Recreate dialog with default values
-            SettingsDialog(self.dialog.master, self.settings, self.data_manager)
+            self.load_values()
+    
+    def load_values(self):
+        """Show the current settings in the existing widgets"""
+        self.theme_var.set(self.settings.get('appearance_mode', 'dark'))
+        self.color_theme_var.set(self.settings.get('color_theme', 'blue'))
+        self.show_weekend_var.set(self.settings.get('show_weekend', False))
+        self.time_format_var.set(self.settings.get('time_format', '24h'))
+        self.auto_save_var.set(self.settings.get('auto_save', True))
+        self.reminder_var.set(self.settings.get('reminder_enabled', True))
+        
+        self.duration_entry.delete(0, tk.END)
+        self.duration_entry.insert(0, str(self.settings.get('default_session_duration', 60)))
+        self.reminder_entry.delete(0, tk.END)
+        self.reminder_entry.insert(0, str(self.settings.get('reminder_minutes', 15)))
     
     def cancel(self):
-        self.dialog.destroy()
+        self.hide()
 
 
 if __name__ == "__main__":